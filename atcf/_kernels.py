@@ -0,0 +1,127 @@
+"""
+atcf/_kernels.py
+
+DESCRIPTION
+-----------
+    Numba-compiled kernels for parsing ATCF files, which are only imported by
+    atcf.py when a file is large enough to benefit from them (importing Numba
+    is itself costly)
+"""
+import numba
+import numpy as np
+
+
+# The compiled kernels release the GIL, so that files parsed from multiple threads
+# (e.g., with a concurrent.futures.ThreadPoolExecutor) are scanned in parallel
+@numba.njit(cache=True, nogil=True)
+def _isspace(b):
+    # Same as str.isspace() for ASCII characters
+    return b == 32 or 9 <= b <= 13 or 28 <= b <= 31
+
+
+@numba.njit(cache=True, nogil=True)
+def _parse_int_bytes(buf, start, end):
+    # Parse the integer in buf[start:end], which is NaN if empty or malformed
+    i = start
+    sign = 1
+    if i < end and (buf[i] == 45 or buf[i] == 43):  # '-' or '+'
+        sign = -1 if buf[i] == 45 else 1
+        i += 1
+    if i == end:
+        return np.nan
+    value = 0
+    while i < end:
+        digit = np.int64(buf[i]) - 48
+        if digit < 0 or digit > 9:
+            return np.nan
+        value = 10*value + digit
+        i += 1
+    return float(sign*value)
+
+
+@numba.njit(cache=True, nogil=True)
+def _scan_lines(buf, text_indices, int_indices):
+    # Compiled counterpart of atcf._tokenize_lines, walking the raw bytes of a file.
+    # First locate the non-blank lines
+    n = buf.shape[0]
+    nmax = 1
+    for pos in range(n):
+        if buf[pos] == 10:
+            nmax += 1
+    starts = np.empty(nmax, np.int64)
+    ends = np.empty(nmax, np.int64)
+    nlines = 0
+    start = 0
+    for pos in range(n + 1):
+        if pos == n or buf[pos] == 10:
+            for j in range(start, pos):
+                if not _isspace(buf[j]):
+                    starts[nlines] = start
+                    ends[nlines] = pos
+                    nlines += 1
+                    break
+            start = pos + 1
+    # Then split each line on commas, stripping whitespace from each field. Text
+    # fields are located first, and copied once the longest one is known
+    nfields = np.zeros(nlines, np.int64)
+    tstarts = np.zeros((nlines, text_indices.shape[0]), np.int64)
+    tends = np.zeros((nlines, text_indices.shape[0]), np.int64)
+    numbers = np.full((nlines, int_indices.shape[0]), np.nan)
+    for line in range(nlines):
+        pos = starts[line]
+        end = ends[line]
+        field = 0
+        while True:
+            fstart = pos
+            while pos < end and buf[pos] != 44:  # ','
+                pos += 1
+            fend = pos
+            while fstart < fend and _isspace(buf[fstart]):
+                fstart += 1
+            while fend > fstart and _isspace(buf[fend-1]):
+                fend -= 1
+            for k in range(text_indices.shape[0]):
+                if text_indices[k] == field:
+                    tstarts[line, k] = fstart
+                    tends[line, k] = fend
+            for k in range(int_indices.shape[0]):
+                if int_indices[k] == field:
+                    numbers[line, k] = _parse_int_bytes(buf, fstart, fend)
+            field += 1
+            if pos >= end:
+                break
+            pos += 1
+        nfields[line] = field
+    width = 1
+    for line in range(nlines):
+        for k in range(text_indices.shape[0]):
+            width = max(width, tends[line, k] - tstarts[line, k])
+    text = np.zeros((nlines, text_indices.shape[0], width), np.uint8)
+    for line in range(nlines):
+        for k in range(text_indices.shape[0]):
+            for j in range(tends[line, k] - tstarts[line, k]):
+                text[line, k, j] = buf[tstarts[line, k] + j]
+    return nfields, text, numbers
+
+
+@numba.njit(cache=True, nogil=True)
+def _decode_coordinates(codes, positive, negative):
+    # Compiled counterpart of atcf._parse_coordinates, reading the character codes
+    # of each coordinate string (zero-padded to a common width)
+    degrees = np.full(codes.shape[0], np.nan)
+    for i in range(codes.shape[0]):
+        n = 0
+        while n < codes.shape[1] and codes[i, n] != 0:
+            n += 1
+        if n < 2 or (codes[i, n-1] != positive and codes[i, n-1] != negative):
+            continue
+        tenths = 0
+        for j in range(n - 1):
+            digit = np.int64(codes[i, j]) - 48
+            if digit < 0 or digit > 9:
+                tenths = -1
+                break
+            tenths = 10*tenths + digit
+        if tenths >= 0:
+            degrees[i] = 0.1*tenths if codes[i, n-1] == positive else -0.1*tenths
+    return degrees
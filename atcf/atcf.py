@@ -22,12 +22,31 @@ CLASSES
 
     Storm:         Storm object constructed from ATCF B-deck data,
                    containing time-ordered arrays of storm attributes
-"""
-__all__ = ['ADeck', 'BDeck', 'ModelForecast', 'Storm']
 
-from datetime import datetime, timedelta
+FUNCTIONS
+---------
+    clear_deck_cache:    Discard the parsed contents of recently read files
+
+    set_deck_cache_size: Set how many recently read files have their parsed
+                         contents kept (0 disables the cache)
+"""
+__all__ = ['ADeck', 'BDeck', 'ModelForecast', 'Storm', 'clear_deck_cache',
+           'set_deck_cache_size']
+
+from collections import defaultdict, OrderedDict
+from datetime import datetime
+from itertools import compress
+from operator import itemgetter
+import functools
+import hashlib
 import logging
+import mmap
 import numpy as np
+import os
+import re
+import sys
+import threading
+import traceback
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +54,355 @@ logger = logging.getLogger(__name__)
 # Map basin IDs to the basin letters used in storm IDs
 basinletters = {'AL': 'L', 'LS': 'Q', 'EP': 'E', 'CP': 'C', 'WP': 'W'}
 
+# Map wind radii thresholds (kt) to the names of their quadrant attributes. The
+# thresholds and quadrants are also the two trailing axes of wind radii arrays
+radii_attrs = {thresh: tuple(f'R{thresh}_{q}' for q in ('NE','SE','SW','NW'))
+               for thresh in (34, 50, 64)}
+
+# Values that mark positive-definite attributes as missing (wind radii are only
+# missing if zero)
+_MISSING_VALUES = (0, -99, -999)
+
+# Files (and columns) with at least this many lines are parsed with the compiled kernels
+# when Numba is available. Below this, pure Python is faster than importing Numba and
+# loading the kernels (about 0.3 s even when they are cached on disk), which a one-off
+# parse pays for on the first call in a process
+_NUMBA_MIN_LINES = 100_000
+
+# Whitespace characters outside ASCII, which str.strip() removes but the compiled
+# kernel does not, so files containing any of them are parsed in Python
+_NON_ASCII_SPACE = re.compile(
+    '[\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]')
+
+# Parsed contents of the most recently read files, keyed by a hash of the file
+# contents, so files that are read repeatedly are only parsed again if they change.
+# The cache is shared by all threads, so it is only accessed under its lock
+_deck_cache_size = 8
+_deck_cache = OrderedDict()
+_deck_cache_lock = threading.Lock()
+
+
+def clear_deck_cache():
+    """Discard the parsed contents of all recently read files"""
+    with _deck_cache_lock:
+        _deck_cache.clear()
+
+
+def set_deck_cache_size(size):
+    """
+    Set how many recently read files have their parsed contents kept, so they are
+    not parsed again if read again unchanged. With a size of 0, files are neither
+    hashed nor kept.
+
+    Args
+    ----
+        size: [int] Number of files (default 8)
+    """
+    global _deck_cache_size
+    if size < 0:
+        raise ValueError(f'Cache size must be non-negative, got {size}')
+    with _deck_cache_lock:
+        _deck_cache_size = size
+        while len(_deck_cache) > size:
+            _deck_cache.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_atcf_time(s):
+    """
+    Parse an ATCF timestamp (YYYYMMDDHH) into a datetime. This is much faster
+    than datetime.strptime, and the same init time is repeated across every
+    forecast hour of a model run, so results are cached.
+    """
+    return datetime(int(s[0:4]), int(s[4:6]), int(s[6:8]), int(s[8:10]))
+
+
+def _parse_atcf_times(values):
+    """
+    Parse an array of ATCF timestamps (YYYYMMDDHH) into datetime64 values, which are
+    NaT for malformed timestamps. The digits are read straight from the character
+    codes of the strings, so no datetime objects are constructed.
+    """
+    values = np.asarray(values, dtype=str)
+    digits = values.astype('U10').view(np.uint32).reshape(-1, 10).astype(np.int64) - ord('0')
+    valid = (np.char.str_len(values) == 10) & ((digits >= 0) & (digits <= 9)).all(axis=1)
+    year = digits[:, 0:4] @ [1000, 100, 10, 1]
+    month = digits[:, 4:6] @ [10, 1]
+    day = digits[:, 6:8] @ [10, 1]
+    hour = digits[:, 8:10] @ [10, 1]
+    months = (12*(year - 1970) + month - 1).astype('datetime64[M]')
+    times = (months.astype('datetime64[m]') + (day - 1).astype('timedelta64[D]')
+             + hour.astype('timedelta64[h]'))
+    # Out-of-range dates and hours are malformed rather than rolled over
+    valid &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (hour <= 23)
+    valid &= times.astype('datetime64[M]') == months
+    times[~valid] = np.datetime64('NaT')
+    return times
+
+
+@functools.lru_cache(maxsize=256)
+def _storm_id(number, basin):
+    """
+    Construct a storm ID (e.g., '01L') from a storm number and 2-letter basin ID,
+    or None if either is invalid. Storm IDs repeat across every entry of a storm,
+    so results are cached and interned.
+    """
+    if number < 0 or basin not in basinletters:
+        return None
+    return sys.intern(f'{number:02}{basinletters[basin]}')
+
+
+def _parse_int(s):
+    """
+    Parse an integer field as a float, which is NaN if it is empty or malformed.
+    Only ASCII digits with an optional sign are integers.
+    """
+    digits = s[1:] if s.startswith(('-', '+')) else s
+    if not (digits.isascii() and digits.isdigit()):
+        return np.nan
+    return int(s)
+
+
+def _parse_ints(values):
+    """
+    Parse an array of integer fields as floats, which are NaN if empty or malformed.
+    The whole array is converted at once if every value is empty or an integer, and
+    values are only parsed one at a time if some of them are malformed.
+    """
+    empty = values == ''
+    # Only ASCII digits after at most one sign are integers, so that values such as
+    # '12.5', '1e3' or 'nan' (which a float conversion would accept) are malformed
+    digits = np.char.lstrip(values, '-+')
+    integer = (digits != '') & (np.char.strip(digits, '0123456789') == '')
+    integer &= np.char.str_len(values) - np.char.str_len(digits) <= 1
+    if (empty | integer).all():
+        return np.where(empty, 'nan', values).astype(float)
+    return np.fromiter(map(_parse_int, values.tolist()), dtype=float, count=values.size)
+
+
+def _parse_coordinates(values, positive, negative):
+    """
+    Parse an array of ATCF coordinate strings, which are given in tenths of a degree
+    followed by a hemisphere letter (e.g., '165N'), into signed degrees. `positive`
+    and `negative` are the hemisphere letters of positive and negative values
+    (e.g., 'N' and 'S'). Malformed values are NaN.
+    """
+    values = np.asarray(values, dtype=str)
+    kernels = _load_kernels() if values.shape[0] >= _NUMBA_MIN_LINES else None
+    if kernels is not None:
+        # Decode the character codes of all values in one compiled loop
+        codes = np.ascontiguousarray(values).view(np.uint32)
+        codes = codes.reshape(values.shape[0], values.itemsize // 4)
+        return kernels._decode_coordinates(codes, ord(positive), ord(negative))
+    negatives = np.char.endswith(values, negative)
+    valid = negatives | np.char.endswith(values, positive)
+    # Only ASCII digits followed by exactly one hemisphere letter are valid
+    tenths = np.char.rstrip(values, positive+negative)
+    valid &= np.char.str_len(values) - np.char.str_len(tenths) == 1
+    valid &= (tenths != '') & (np.char.strip(tenths, '0123456789') == '')
+    degrees = 0.1*np.where(valid, tenths, '0').astype(float)
+    degrees[negatives] *= -1
+    degrees[~valid] = np.nan
+    return degrees
+
+
+def _mask_missing(values, dtype):
+    """
+    Copy the values of a positive-definite attribute into a preallocated array of
+    its column dtype, leaving values that mark the attribute as missing as NaN
+    """
+    masked = np.full(values.shape, np.nan, dtype=dtype)
+    np.copyto(masked, values, where=~np.isin(values, _MISSING_VALUES))
+    return masked
+
+
+def _tokenize_lines(lines, text_fields, int_fields):
+    """
+    Parse fields from the lines of an ATCF file into per-line column arrays. Fields
+    missing from a line are empty strings (text) or NaN (integers).
+
+    Args
+    ----
+        lines:       [list(str)]     Lines of an ATCF file
+        text_fields: [dict(str,int)] Map column names to the index of a text field
+        int_fields:  [dict(str,int)] Map column names to the index of an integer field
+
+    Returns
+    -------
+        [dict(str,array)] Per-line column arrays, plus the number of fields per
+                          line under 'nfields'
+    """
+    # Split each line into fields once. Only the needed fields are stripped of
+    # whitespace, a whole column at a time
+    parsed = [line.split(',') for line in lines]
+    table = {'nfields': np.fromiter(map(len, parsed), dtype=int, count=len(parsed))}
+    # Pad short lines once, so that each field is gathered for all lines by a C-level
+    # itemgetter rather than checking the length of every line for every field
+    nneeded = max(max(text_fields.values()), max(int_fields.values())) + 1
+    for fields in compress(parsed, (table['nfields'] < nneeded).tolist()):
+        fields.extend([''] * (nneeded - len(fields)))
+    for name, i in text_fields.items():
+        table[name] = np.char.strip(np.array(list(map(itemgetter(i), parsed)), dtype=str))
+    for name, i in int_fields.items():
+        # Integer fields are usually well-formed wherever they are present, so they
+        # are first parsed directly with int() (which ignores surrounding whitespace),
+        # only falling back to the slower, strict parse if that fails. int() also
+        # accepts underscores and non-ASCII digits, so those always fall back
+        present = table['nfields'] > i
+        values = list(map(itemgetter(i), parsed if present.all() else compress(parsed, present)))
+        joined = ''.join(values)
+        try:
+            if '_' in joined or not joined.isascii():
+                raise ValueError
+            numbers = np.full(len(parsed), np.nan)
+            numbers[present] = np.fromiter(map(int, values), dtype=float, count=len(values))
+        except ValueError:
+            numbers = _parse_ints(np.char.strip(np.array(list(map(itemgetter(i), parsed)),
+                                                         dtype=str)))
+        table[name] = numbers
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def _load_kernels():
+    """
+    Import the compiled kernels (see _kernels.py) on first use, so that Numba is only
+    imported if a file is large enough to need it. None if Numba is not available.
+    """
+    try:
+        from . import _kernels
+    except ImportError:
+        return None
+    return _kernels
+
+
+def _scan_bytes(buf, text_fields, int_fields):
+    """
+    Parse fields from the raw bytes of an ATCF file into per-line column arrays
+    using the compiled kernel. The result is the same as from _tokenize_lines.
+    """
+    nfields, text, numbers = _load_kernels()._scan_lines(
+        buf, np.array(list(text_fields.values()), dtype=np.int64),
+        np.array(list(int_fields.values()), dtype=np.int64)
+    )
+    table = {'nfields': nfields}
+    for k, name in enumerate(text_fields):
+        # Text fields are zero-padded to the length of the longest one
+        raw = np.ascontiguousarray(text[:, k]).view(f'S{text.shape[2]}')[:, 0]
+        table[name] = np.char.decode(raw, 'utf-8')
+    for k, name in enumerate(int_fields):
+        table[name] = numbers[:, k]
+    return table
+
+
+def _read_deck(filename, text_fields, int_fields):
+    """
+    Read the non-empty, whitespace-stripped lines of an ATCF file, and parse fields
+    from each line into per-line column arrays (see _tokenize_lines). The file is
+    memory-mapped and decoded in one go rather than buffered line by line. Large
+    files are parsed straight from the mapped bytes by a compiled kernel when
+    Numba is available. Results for recently read file contents are reused (see
+    set_deck_cache_size).
+
+    Returns
+    -------
+        [tuple(list(str),dict(str,array))] Lines of the file and their column arrays
+    """
+    with open(filename, 'rb') as f:
+        # Empty files cannot be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return [], _tokenize_lines([], text_fields, int_fields)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            key = None
+            if _deck_cache_size > 0:
+                key = (hashlib.blake2b(mm, digest_size=16).digest(),
+                       tuple(text_fields.items()), tuple(int_fields.items()))
+                with _deck_cache_lock:
+                    cached = _deck_cache.get(key)
+                    if cached is not None:
+                        _deck_cache.move_to_end(key)
+                if cached is not None:
+                    lines, table = cached
+                    return list(lines), dict(table)
+            text = str(mm, 'utf-8')
+            lines = [l for l in map(str.strip, text.split('\n')) if l]
+            # The kernel must find the same non-blank lines and field boundaries as
+            # str.strip(), or its rows would fall out of step with the lines
+            if (len(lines) >= _NUMBA_MIN_LINES and not _NON_ASCII_SPACE.search(text)
+                    and _load_kernels() is not None):
+                buf = np.frombuffer(mm, dtype=np.uint8)
+                try:
+                    table = _scan_bytes(buf, text_fields, int_fields)
+                except BaseException as error:
+                    # The traceback's frames also hold the buffer, which would keep
+                    # the map from closing and hide the error behind a BufferError
+                    traceback.clear_frames(error.__traceback__)
+                    raise
+                finally:
+                    # Release the buffer so the map can be closed
+                    del buf
+            else:
+                table = _tokenize_lines(lines, text_fields, int_fields)
+    if key is None:
+        return lines, table
+    with _deck_cache_lock:
+        _deck_cache[key] = (lines, table)
+        while len(_deck_cache) > _deck_cache_size:
+            _deck_cache.popitem(last=False)
+    return list(lines), dict(table)
+
+
+def _collect_radii(table, groups, columns, dtype):
+    """
+    Fill the wind radii array of a set of entries from the lines of each entry,
+    which hold the radii of one threshold each. Radii that are zero or not present
+    in an entry are missing.
+
+    Args
+    ----
+        table:   [dict(str,array)]  Per-line column arrays of an ATCF file
+        groups:  [list(list(int))]  Indices of the lines of each entry
+        columns: [dict(str,array)]  Per-entry column arrays, to which the wind radii
+                                    array (entry, threshold, quadrant) is added
+        dtype:   [dtype]            Dtype of the wind radii array
+
+    Returns
+    -------
+        [array(bool)] Entries with a malformed wind radii threshold
+    """
+    nlines = np.fromiter(map(len, groups), dtype=int, count=len(groups))
+    rows = np.repeat(np.arange(len(groups)), nlines)
+    lines = np.fromiter((i for group in groups for i in group), dtype=int, count=nlines.sum())
+    thresh = table['thresh'][lines]
+    quads = np.stack([table[quad][lines] for quad in ('NE','SE','SW','NW')], axis=-1)
+    columns['wind_radii'] = np.full((len(groups), len(radii_attrs), 4), np.nan, dtype=dtype)
+    for slot, thr in enumerate(radii_attrs):
+        with_thresh = thresh == thr
+        radii = quads[with_thresh]
+        columns['wind_radii'][rows[with_thresh], slot] = np.where(radii == 0, np.nan, radii)
+    malformed = np.zeros(len(groups), dtype=bool)
+    malformed[rows[np.isnan(thresh)]] = True
+    return malformed
+
+
+def _radii_views(wind_radii):
+    """
+    Map the name of each wind radii attribute (e.g., 'R34_NE') to a view onto its
+    threshold and quadrant of a wind radii array (time, threshold, quadrant)
+    """
+    return {attr: wind_radii[:, slot, quad] for slot, attrs in enumerate(radii_attrs.values())
+            for quad, attr in enumerate(attrs)}
+
+
+def _field_indices(attr_indices, names):
+    """
+    Map the names of the fields parsed from each line of a deck to their index in
+    the deck's attr_indices. A wind radii quadrant (e.g., 'NE') names the field
+    holding that quadrant's radius for whichever threshold a line has.
+    """
+    return {name: attr_indices[name] if name in attr_indices else attr_indices[f'R34_{name}']
+            for name in names}
+
 
 class ADeck:
     """
@@ -44,10 +412,13 @@ class ADeck:
     ----------
         lines:           [list(str)]        List of lines from the input file
 
-        line_timegroups: [dict(str,list)]   Groups of lines from the input file
-                                            associated with a single time/entry
+        line_timegroups: [dict(tuple,dict)] Groups of lines from the input file
+                                            associated with a single time/entry, keyed
+                                            by (storm number, modelname, init) and then
+                                            by forecast hour
 
-        entries:         [list(ADeckEntry)] List of ADeckEntry objects
+        entries:         [list(ADeckEntry)] List of ADeckEntry objects, each a view onto
+                                            one row of the parsed columns
 
         entries_by_modelrun: [dict(tuple, list(ADeckEntry))]
             Maps each (stormID, modelname, init) tuple to a list of ADeckEntry objects
@@ -68,12 +439,32 @@ class ADeck:
         'lon': 7, 'vmax': 8, 'pmin': 9, 'R34_NE': 13, 'R34_SE': 14, 'R34_SW': 15,
         'R34_NW': 16, 'R50_NE': 13, 'R50_SE': 14, 'R50_SW': 15, 'R50_NW': 16,
         'R64_NE': 13, 'R64_SE': 14, 'R64_SW': 15, 'R64_NW': 16, 'poci': 17,
-        'roci': 18, 'rmw': 19
+        'roci': 18, 'rmw': 19, 'thresh': 11
     }
 
-    # Possible missing values for whitespace-stripped fields
+    # Possible missing values for whitespace-stripped fields. No longer used for
+    # parsing (see _MISSING_VALUES), but kept for compatibility
     missing_values = ['', '-99', '-999']
 
+    # Minimum number of fields (through the wind radii threshold) in a valid line
+    min_fields = 12
+
+    # Map the text and integer fields parsed from each line to their field index
+    text_fields = _field_indices(attr_indices, ('basin', 'init', 'modelname', 'lat', 'lon'))
+    int_fields = _field_indices(attr_indices, (
+        'number', 'fhour', 'vmax', 'pmin', 'thresh', 'NE', 'SE', 'SW', 'NW', 'poci',
+        'roci', 'rmw'
+    ))
+
+    # Map entry attributes to the dtype of their column in the parsed A-deck. Text
+    # columns are fixed-width strings, with `str` sized to the longest value
+    dtypes = {
+        'modelname': str, 'basin': 'U2', 'number': int, 'stormID': str,
+        'init': 'datetime64[m]', 'fhour': np.int16, 'validtime': 'datetime64[m]',
+        'lat': np.float32, 'lon': np.float32, 'vmax': np.float32, 'pmin': np.float32,
+        'rmw': np.float32, 'poci': np.float32, 'roci': np.float32, 'wind_radii': np.float32
+    }
+
     def __init__(self, filename):
         """
         Args
@@ -81,41 +472,98 @@ class ADeck:
             filename: [str] ATCF A-deck filename
         """
         self.filename = filename
-        with open(self.filename) as f:
-            self.lines = [l.strip() for l in f.readlines() if len(l.strip()) > 0]
-        # Tag each line with its storm ID, model name, init time, and forecast hour
-        lineIDs = {}
-        for line in self.lines:
-            fields = [f.strip() for f in line.split(',')]
-            stormnum = fields[self.attr_indices['number']]
-            modelname = fields[self.attr_indices['modelname']]
-            init = datetime.strptime(fields[self.attr_indices['init']], '%Y%m%d%H')
-            fhour = int(fields[self.attr_indices['fhour']])
-            lineIDs[(stormnum, modelname, init, fhour)] = line
-        # Group lines by time for each storm and model run. If multiple wind radii
-        # thresholds exist, multiple lines will exist for each lead time
-        self.line_timegroups = {
-            (stormnum, modelname, init): {} for stormnum, modelname, init
-            in set((ID, mname, it) for ID, mname, it, _ in lineIDs.keys())
+        self.lines, table = _read_deck(self.filename, self.text_fields, self.int_fields)
+        # Full storm ID and init time of each line. Storm IDs repeat across many
+        # lines, so each distinct ID is only constructed once
+        numbers = np.nan_to_num(table['number'], nan=-1).astype(int)
+        stormIDs = [_storm_id(number, basin)
+                    for number, basin in zip(numbers.tolist(), table['basin'].tolist())]
+        inits = _parse_atcf_times(table['init'])
+        # Lines too short to describe an entry or without a valid storm, init time,
+        # or forecast hour are masked out up front and skipped with a single warning
+        valid = ((table['nfields'] >= self.min_fields) & (numbers >= 0)
+                 & np.isin(table['basin'], list(basinletters)) & ~np.isnat(inits)
+                 & ~np.isnan(table['fhour']))
+        if not valid.all():
+            logger.warning(f'skipping {np.count_nonzero(~valid)} malformed A-deck lines')
+        inits = inits.tolist()
+        # Model names are shared by many lines, so intern them to share one string
+        # object per model, which also speeds up hashing of the model run keys
+        modelnames = list(map(sys.intern, table['modelname'].tolist()))
+        # Group lines by time for each storm and model run, using each line's storm ID,
+        # model name, init time, and forecast hour. If multiple wind radii thresholds
+        # exist, multiple lines will exist for each lead time
+        line_timegroups = defaultdict(lambda: defaultdict(list))
+        linekeys = zip(stormIDs, modelnames, inits, table['fhour'].tolist())
+        for i, (stormID, modelname, init, fhour) in compress(enumerate(linekeys),
+                                                             valid.tolist()):
+            line_timegroups[(stormID, modelname, init)][int(fhour)].append(i)
+        # The public line groups are keyed by the storm number as written in the file
+        # (e.g., '09') rather than the storm ID, model name, and init time
+        self.line_timegroups = {}
+        for (_, modelname, init), timegroups in line_timegroups.items():
+            firstline = self.lines[next(iter(timegroups.values()))[0]]
+            stormnum = firstline.split(',')[self.attr_indices['number']].strip()
+            linegroups = self.line_timegroups.setdefault((stormnum, modelname, init), {})
+            for fhour, group in timegroups.items():
+                linegroups.setdefault(fhour, []).extend(self.lines[i] for i in group)
+        # Parse entries from each time group into one row of a set of column
+        # arrays (struct-of-arrays), which is ordered by time
+        groups, inits, fhours = [], [], []
+        for (_, _, init), timegroups in line_timegroups.items():
+            for fhour, group in timegroups.items():
+                groups.append(group)
+                inits.append(init)
+                fhours.append(fhour)
+        # For most attributes, can use any of the lines from the time group
+        first = np.fromiter((group[0] for group in groups), dtype=int, count=len(groups))
+        columns = {
+            'modelname': [modelnames[i] for i in first.tolist()],
+            # Two-letter ocean basin designation
+            'basin': table['basin'][first],
+            # Storm ID number, 90+ for invests, 01+ for TCs
+            'number': numbers[first],
+            # Full ID includes the basin identifier for the originating basin (e.g., 01L)
+            'stormID': [stormIDs[i] for i in first.tolist()],
+            # Initialization time, forecast hour / lead time, and valid time are
+            # already known from the time groups
+            'init': inits,
+            'fhour': fhours,
+            'validtime': (np.array(inits, dtype='datetime64[m]')
+                          + np.array(fhours, dtype='timedelta64[h]')),
+            # Coordinates (longitude in [-180, 180])
+            'lat': _parse_coordinates(table['lat'][first], 'N', 'S'),
+            'lon': _parse_coordinates(table['lon'][first], 'E', 'W'),
+            # Maximum sustained wind speed (kt)
+            'vmax': table['vmax'][first],
         }
-        for ID, line in lineIDs.items():
-            stormnum, modelname, init, fhour = ID
-            self.line_timegroups[(stormnum, modelname, init)].setdefault(fhour, []).append(line)
-        # Parse entries from each line of the file, which is ordered by time
-        self.entries = []
-        for ID, timegroups in self.line_timegroups.items():
-            for group in timegroups.values():
-                try:
-                    entry = ADeckEntry(group)
-                except:
-                    logger.exception('error parsing A-deck entry; skipping')
-                else:
-                    self.entries.append(entry)
-        # Group entries by storm and model since multiple storms and/or models
-        # may appear in the file
-        self.entries_by_modelrun = {}
-        for e in self.entries:
-            self.entries_by_modelrun.setdefault((e.stormID, e.modelname, e.init), []).append(e)
+        # Attributes that may be missing and are positive definite. These (and the
+        # wind radii) are written straight into arrays of their final dtype
+        for attr in ('pmin', 'poci', 'roci', 'rmw'):
+            columns[attr] = _mask_missing(table[attr][first], self.dtypes[attr])
+        # Wind radii (nm) of 34 kt, 50 kt, or 64 kt, dependent on the threshold(s) specified
+        malformed = _collect_radii(table, groups, columns, self.dtypes['wind_radii'])
+        columns = {attr: np.asarray(columns[attr], dtype=dtype)
+                   for attr, dtype in self.dtypes.items()}
+        malformed |= np.isnan(columns['vmax'] + columns['lat'] + columns['lon'])
+        if malformed.any():
+            logger.error(f'malformed values in {malformed.sum()} A-deck entries; skipping')
+            columns = {attr: column[~malformed] for attr, column in columns.items()}
+        # Individual wind radii (e.g., R34_NE) are views onto the wind radii array
+        columns.update(_radii_views(columns['wind_radii']))
+        self._columns = columns
+        # Create entries and group them by storm and model as they are created,
+        # since multiple storms and/or models may appear in the file
+        self.entries = [None] * len(columns['init'])
+        entries_by_modelrun = defaultdict(list)
+        modelruns = zip(map(sys.intern, columns['stormID'].tolist()),
+                        map(sys.intern, columns['modelname'].tolist()),
+                        columns['init'].tolist())
+        for row, modelrun in enumerate(modelruns):
+            entry = ADeckEntry(columns, row)
+            self.entries[row] = entry
+            entries_by_modelrun[modelrun].append(entry)
+        self.entries_by_modelrun = dict(entries_by_modelrun)
 
     def get_forecast(self, stormID=None, modelname=None, init=None):
         """
@@ -145,15 +593,20 @@ class ADeck:
         return self.__str__()
 
     def __str__(self):
-        nruns = len(self.entries_by_modelrun.keys())
-        nstorms, nmodels, _ = map(len, map(set, zip(*list(self.entries_by_modelrun.keys()))))
+        nruns = len(self.entries_by_modelrun)
+        storms, models = set(), set()
+        for stormID, modelname, _ in self.entries_by_modelrun:
+            storms.add(stormID)
+            models.add(modelname)
+        nstorms, nmodels = len(storms), len(models)
         return (f'<ADeck with {nruns} model runs from {nmodels} models '
                 f'for {nstorms} storms>')
 
 
 class ADeckEntry:
     """
-    Define a single entry from an ATCF A-Deck file.
+    Define a single entry from an ATCF A-Deck file. Entries are lightweight views
+    onto one row of the column arrays of a parsed A-deck.
 
     Attributes
     ----------
@@ -176,63 +629,36 @@ class ADeckEntry:
                                    where `quad` is one of ['NE','SE','SW','NW']
         R64_{quad}:     [float]    Radius of 64kt wind (nm) in the `quad` quadrant,
                                    where `quad` is one of ['NE','SE','SW','NW']
+        wind_radii:     [array(float)] All wind radii (nm), with shape (threshold, quadrant)
+                                       for thresholds [34,50,64] and quadrants
+                                       ['NE','SE','SW','NW']
     """
-    def __init__(self, lines):
+    __slots__ = ('_columns', '_row')
+
+    def __init__(self, columns, row):
         """
         Args
         ----
-            lines: [list(str)] List of lines from an ATCF A-deck file describing one entry
+            columns: [dict(str,array)] Column arrays of a parsed A-deck (see ADeck.dtypes)
+            row:     [int]             Row of this entry in the column arrays
         """
-        # For most attributes, can use any of the lines from the time group
-        fields = [s.strip() for s in lines[0].split(',')]
-        self.modelname = fields[ADeck.attr_indices['modelname']]
-        # Two-letter ocean basin designation
-        self.basin = fields[ADeck.attr_indices['basin']]
-        # Storm ID number, 90+ for invests, 01+ for TCs
-        self.number = int(fields[ADeck.attr_indices['number']])
-        # Full ID includes the basin identifier for the originating basin (e.g., 01L)
-        self.stormID = f'{self.number:02}{basinletters[self.basin]}'
-        # Initialization time
-        self.init = datetime.strptime(fields[ADeck.attr_indices['init']], '%Y%m%d%H')
-        # Forecast hour / lead time
-        self.fhour = int(fields[ADeck.attr_indices['fhour']])
-        self.validtime = self.init + timedelta(hours=self.fhour)
-        # Coordinates (longitude in [-180, 180])
-        lat, lon = fields[ADeck.attr_indices['lat']], fields[ADeck.attr_indices['lon']]
-        if lat[-1] == 'N':
-            self.lat = 0.1*float(lat[:-1])
-        elif lat[-1] == 'S':
-            self.lat = -0.1*float(lat[:-1])
-        if lon[-1] == 'W':
-            self.lon = -0.1*float(lon[:-1])
-        elif lon[-1] == 'E':
-            self.lon = 0.1*float(lon[:-1])
-        # Maximum sustained wind speed (kt)
-        self.vmax = int(fields[ADeck.attr_indices['vmax']])
-        # Attributes that may be missing and are positive definite
-        for attr in ('pmin', 'poci', 'roci', 'rmw'):
-            # These values may not exist in the entry at all
-            try:
-                valstr = fields[ADeck.attr_indices[attr]]
-            except IndexError:
-                value = np.nan
-            else:
-                value = int(valstr) if valstr not in ADeck.missing_values+['0'] else np.nan
-            setattr(self, attr, value)
-        # Wind radii (nm) of 34 kt, 50 kt, or 64 kt, dependent on the threshold(s) specified
-        for line in lines:
-            lfields = [s.strip() for s in line.split(',')]
-            thresh = int(lfields[11]) # kt
-            if thresh == 0:
-                continue
-            attrs = [f'R{thresh}_{quad}' for quad in ('NE','SE','SW','NW')]
-            for attr in attrs:
-                setattr(self, attr, int(lfields[ADeck.attr_indices[attr]]))
-        # Set wind radii that are not present to missing
-        radii_attrs = [f'R{thresh}_{q}' for thresh in (34, 50, 64) for q in ('NE','SE','SW','NW')]
-        for attr in radii_attrs:
-            if not getattr(self, attr, None):
-                setattr(self, attr, np.nan)
+        self._columns = columns
+        self._row = row
+
+    def __getattr__(self, attr):
+        # Only reached for entry attributes, which live in the column arrays
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        try:
+            column = self._columns[attr]
+        except KeyError:
+            raise AttributeError(f"'ADeckEntry' object has no attribute '{attr}'") from None
+        return column.item(self._row)
+
+    @property
+    def wind_radii(self):
+        # A (threshold, quadrant) view onto this entry's row of the wind radii array
+        return self._columns['wind_radii'][self._row]
 
     def __repr__(self):
         return self.__str__()
@@ -268,6 +694,9 @@ class ModelForecast:
                                           where `quad` is one of ['NE','SE','SW','NW']
         R64_{quad}:     [array(float)]    Radius of 64kt wind (nm) in the `quad` quadrant,
                                           where `quad` is one of ['NE','SE','SW','NW']
+        wind_radii:     [array(float)]    All wind radii (nm), with shape (time, threshold,
+                                          quadrant) for thresholds [34,50,64] and quadrants
+                                          ['NE','SE','SW','NW']. R##_{quad} are views onto it
     """
     def __init__(self, adeck, stormID=None, modelname=None, init=None):
         """
@@ -282,49 +711,50 @@ class ModelForecast:
             modelname: [str]                         Requested model name
             init:      [datetime or str(YYYYMMDDHH)] Requested model initialization time
         """
-        # Identify needed A-deck entries
-        needed_entries = adeck.entries
-        if stormID is None and len(set(e.stormID for e in needed_entries)) > 1:
+        # Identify the needed model run from the (stormID, modelname, init) keys
+        # of the A-deck's model runs, rather than by scanning all entries
+        modelruns = list(adeck.entries_by_modelrun)
+        if stormID is None and len(set(ID for ID, _, _ in modelruns)) > 1:
             raise ValueError('No storm ID requested, but multiple storms exist in A-deck')
         else:
-            needed_entries = [e for e in needed_entries if stormID is None
-                              or e.stormID == stormID]
-        if modelname is None and len(set(e.modelname for e in needed_entries)) > 1:
+            modelruns = [run for run in modelruns if stormID is None or run[0] == stormID]
+        if modelname is None and len(set(mname for _, mname, _ in modelruns)) > 1:
             raise ValueError('No model requested, but multiple models exist in A-deck')
         else:
-            needed_entries = [e for e in needed_entries if modelname is None
-                              or e.modelname == modelname]
-        init = datetime.strptime(init, '%Y%m%d%H') if type(init) is str else init
-        if init is None and len(set(e.init for e in needed_entries)) > 1:
+            modelruns = [run for run in modelruns if modelname is None or run[1] == modelname]
+        init = _parse_atcf_time(init) if type(init) is str else init
+        if init is None and len(set(it for _, _, it in modelruns)) > 1:
             raise ValueError('No init time requested, but multiple model runs exist in A-deck')
         else:
-            needed_entries = [e for e in needed_entries if init is None
-                              or e.init == init]
-        if not needed_entries:
+            modelruns = [run for run in modelruns if init is None or run[2] == init]
+        if not modelruns:
             raise ValueError(f'No A-deck entries found matching stormID={stormID}, '
                              f'modelname={modelname}, init={init}')
+        # The entries of a model run occupy consecutive rows of the A-deck columns,
+        # so the forecast arrays are sliced from those rows rather than gathered
+        entries = adeck.entries_by_modelrun[modelruns[0]]
+        needed_rows = slice(entries[0]._row, entries[-1]._row + 1)
 
         # Collect time-dependent attributes
         dtypes = {
-            'basin': 'U2', 'lat': float, 'lon': float, 'fhour': int,
-            'validtime': 'datetime64[m]', 'vmax': float, 'pmin': float,
-            'rmw': float, 'poci': float, 'roci': float, 'R34_NE': float, 'R34_SE': float,
-            'R34_SW': float, 'R34_NW': float, 'R50_NE': float, 'R50_SE': float,
-            'R50_SW': float, 'R50_NW': float, 'R64_NE': float, 'R64_SE': float,
-            'R64_SW': float, 'R64_NW': float
+            'basin': 'U2', 'lat': np.float32, 'lon': np.float32, 'fhour': np.int16,
+            'validtime': 'datetime64[m]', 'vmax': np.float32, 'pmin': np.float32,
+            'rmw': np.float32, 'poci': np.float32, 'roci': np.float32, 'wind_radii': np.float32
         }
-        # Create arrays
+        # Create arrays by copying the needed rows of each A-deck column, so that
+        # modifying a forecast does not modify the A-deck
         for attr, dtype in dtypes.items():
-            arr = np.array([getattr(entry, attr) for entry in needed_entries], dtype=dtype)
-            setattr(self, attr, arr)
+            setattr(self, attr, adeck._columns[attr][needed_rows].astype(dtype))
+        for attr, radii in _radii_views(self.wind_radii).items():
+            setattr(self, attr, radii)
 
         # Collect time-invariant attributes
-        self.modelname = needed_entries[0].modelname
-        self.init = needed_entries[0].init
-        self.stormID = needed_entries[0].stormID
+        self.stormID, self.modelname, self.init = modelruns[0]
+        # The forecast's identity is fixed, so its hash is only computed once
+        self._hash = hash((self.modelname, self.stormID, self.init))
 
     def __hash__(self):
-        return hash((self.modelname, self.stormID, self.init))
+        return self._hash
 
     def __repr__(self):
         return self.__str__()
@@ -345,15 +775,19 @@ class BDeck:
         line_timegroups: [dict(str,list)]   Groups of lines from the input file
                                             associated with a single time/entry
 
-        entries:         [list(BDeckEntry)] List of BDeckEntry objects
+        entries:         [list(BDeckEntry)] List of BDeckEntry objects, each a view onto
+                                            one row of the parsed columns
 
-        entries_by_time: [dict(datetime, BDeckEntry)] Maps each observation time
-                                                      to a BDeckEntry object
+        entries_by_time: [dict(int, BDeckEntry)] Maps each observation time, in hours
+                                                 since 1970-01-01, to a BDeckEntry object
 
         stormID:         [str]              Storm ID (e.g., '01L')
 
     Methods
     -------
+        entry_at(time):
+            Get the BDeckEntry object for an observation time
+
         as_storm():
             Construct a Storm object from this B-deck
     """
@@ -364,12 +798,35 @@ class BDeck:
         'R34_SW': 15, 'R34_NW': 16, 'R50_NE': 13, 'R50_SE': 14,
         'R50_SW': 15, 'R50_NW': 16, 'R64_NE': 13, 'R64_SE': 14,
         'R64_SW': 15, 'R64_NW': 16, 'poci': 17, 'roci': 18,
-        'rmw': 19, 'maxgust': 20, 'eye_diameter': 21, 'name': 27
+        'rmw': 19, 'maxgust': 20, 'eye_diameter': 21, 'name': 27, 'thresh': 11
     }
 
-    # Possible missing values for whitespace-stripped fields
+    # Possible missing values for whitespace-stripped fields. No longer used for
+    # parsing (see _MISSING_VALUES), but kept for compatibility
     missing_values = ['', '-99', '-999']
 
+    # Minimum number of fields (through the wind radii threshold) in a valid line
+    min_fields = 12
+
+    # Map the text and integer fields parsed from each line to their field index
+    text_fields = _field_indices(attr_indices, (
+        'basin', 'time', 'lat', 'lon', 'classification', 'name'
+    ))
+    int_fields = _field_indices(attr_indices, (
+        'number', 'vmax', 'pmin', 'thresh', 'NE', 'SE', 'SW', 'NW', 'poci', 'roci',
+        'rmw', 'maxgust', 'eye_diameter'
+    ))
+
+    # Map entry attributes to the dtype of their column in the parsed B-deck. Text
+    # columns are fixed-width strings, with `str` sized to the longest value
+    dtypes = {
+        'basin': 'U2', 'number': int, 'stormID': str, 'stormname': str,
+        'time': 'datetime64[m]', 'lat': np.float32, 'lon': np.float32, 'vmax': np.float32,
+        'pmin': np.float32, 'poci': np.float32, 'roci': np.float32, 'rmw': np.float32,
+        'maxgust': np.float32, 'eye_diameter': np.float32, 'classification': 'U2',
+        'wind_radii': np.float32
+    }
+
     def __init__(self, filename):
         """
         Args
@@ -377,25 +834,75 @@ class BDeck:
             filename: [str] ATCF B-deck filename
         """
         self.filename = filename
-        with open(self.filename) as f:
-            self.lines = [l.strip() for l in f.readlines() if len(l.strip()) > 0]
-        # Group lines by time. If multiple wind radii thresholds exist,
-        # multiple lines will exist for each ob
-        self.line_timegroups = {}
-        for line in self.lines:
-            timestr = line.split(',')[self.attr_indices['time']].strip()
-            self.line_timegroups.setdefault(timestr, []).append(line)
-        # Parse entries from each line of the file, which is ordered by time
-        self.entries = []
-        for group in self.line_timegroups.values():
-            try:
-                entry = BDeckEntry(group)
-            except:
-                logger.exception('error parsing B-deck entry; skipping')
-            else:
-                self.entries.append(entry)
-        self.entries_by_time = {entry.time: entry for entry in self.entries}
-        self.stormID = self.entries[0].stormID
+        self.lines, table = _read_deck(self.filename, self.text_fields, self.int_fields)
+        # Lines too short to describe an entry or without a valid storm are skipped
+        numbers = np.nan_to_num(table['number'], nan=-1).astype(int)
+        valid = ((table['nfields'] >= self.min_fields) & (numbers >= 0)
+                 & np.isin(table['basin'], list(basinletters)))
+        lines = np.flatnonzero(valid)
+        # Group lines by time, in order of each time's first appearance in the file.
+        # If multiple wind radii thresholds exist, multiple lines will exist for each ob
+        timestrs, firstseen, inverse = np.unique(table['time'][lines], return_index=True,
+                                                 return_inverse=True)
+        timegroups = np.split(lines[np.argsort(inverse, kind='stable')],
+                              np.cumsum(np.bincount(inverse))[:-1])
+        # Each distinct time is only parsed once, and lines with a malformed time
+        # are skipped as well
+        times = _parse_atcf_times(timestrs)
+        timestrs = timestrs.tolist()
+        order = [k for k in np.argsort(firstseen, kind='stable').tolist()
+                 if not np.isnat(times[k])]
+        groups = [timegroups[k] for k in order]
+        nskipped = len(self.lines) - sum(len(group) for group in groups)
+        if nskipped:
+            logger.warning(f'skipping {nskipped} malformed B-deck lines')
+        self.line_timegroups = {timestrs[k]: [self.lines[i] for i in timegroups[k].tolist()]
+                                for k in order}
+        # Parse entries from each time group into one row of a set of column
+        # arrays (struct-of-arrays), which is ordered by time. For most attributes,
+        # can use any of the lines from the time group
+        first = np.fromiter((group[0] for group in groups), dtype=int, count=len(groups))
+        columns = {
+            # Two-letter ocean basin designation
+            'basin': table['basin'][first],
+            # Storm ID number, 90+ for invests, 01+ for TCs
+            'number': numbers[first],
+            # Full ID includes the basin identifier for the originating basin (e.g., 01L)
+            'stormID': [_storm_id(number, basin) for number, basin
+                        in zip(numbers[first].tolist(), table['basin'][first].tolist())],
+            # Storm name (not always present in the file)
+            'stormname': np.where(table['nfields'][first] > self.text_fields['name'],
+                                  table['name'][first], 'NONAME'),
+            # Observation time
+            'time': times[order],
+            # Coordinates (longitude in [-180, 180])
+            'lat': _parse_coordinates(table['lat'][first], 'N', 'S'),
+            'lon': _parse_coordinates(table['lon'][first], 'E', 'W'),
+            # Maximum sustained wind speed (kt)
+            'vmax': table['vmax'][first],
+            # 2-letter storm classification
+            'classification': table['classification'][first],
+        }
+        # Attributes that may be missing and are positive definite. These (and the
+        # wind radii) are written straight into arrays of their final dtype
+        for attr in ('pmin', 'poci', 'roci', 'rmw', 'maxgust', 'eye_diameter'):
+            columns[attr] = _mask_missing(table[attr][first], self.dtypes[attr])
+        # Wind radii (nm) of 34 kt, 50 kt, or 64 kt, dependent on the threshold(s) specified
+        malformed = _collect_radii(table, groups, columns, self.dtypes['wind_radii'])
+        columns = {attr: np.asarray(columns[attr], dtype=dtype)
+                   for attr, dtype in self.dtypes.items()}
+        malformed |= np.isnan(columns['vmax'] + columns['lat'] + columns['lon'])
+        if malformed.any():
+            logger.error(f'malformed values in {malformed.sum()} B-deck entries; skipping')
+            columns = {attr: column[~malformed] for attr, column in columns.items()}
+        # Individual wind radii (e.g., R34_NE) are views onto the wind radii array
+        columns.update(_radii_views(columns['wind_radii']))
+        self._columns = columns
+        self.entries = [BDeckEntry(self._columns, row) for row in range(len(columns['time']))]
+        # Integer keys hash much faster than datetimes for repeated lookups
+        hours = columns['time'].astype('datetime64[h]').astype('int64').tolist()
+        self.entries_by_time = dict(zip(hours, self.entries))
+        self.stormID = sys.intern(self.entries[0].stormID)
 
     def __repr__(self):
         return self.__str__()
@@ -403,6 +910,17 @@ class BDeck:
     def __str__(self):
         return f'<BDeck for storm={self.stormID} with {len(self.entries)} entries>'
 
+    def entry_at(self, time):
+        """
+        Get the BDeckEntry object for an observation time
+
+        Args
+        ----
+            time: [datetime or str(YYYYMMDDHH)] Observation time
+        """
+        time = _parse_atcf_time(time) if type(time) is str else time
+        return self.entries_by_time[np.datetime64(time, 'h').astype('int64').item()]
+
     def as_storm(self):
         """Construct a Storm object from this B-deck"""
         return Storm(self)
@@ -410,7 +928,8 @@ class BDeck:
 
 class BDeckEntry:
     """
-    Define a single entry from an ATCF B-deck file.
+    Define a single entry from an ATCF B-deck file. Entries are lightweight views
+    onto one row of the column arrays of a parsed B-deck.
 
     Attributes
     ----------
@@ -434,66 +953,36 @@ class BDeckEntry:
                                           where `quad` is one of ['NE','SE','SW','NW']
         R64_{quad}:     [float]    Radius of 64kt wind (nm) in the `quad` quadrant,
                                           where `quad` is one of ['NE','SE','SW','NW']
+        wind_radii:     [array(float)] All wind radii (nm), with shape (threshold, quadrant)
+                                       for thresholds [34,50,64] and quadrants
+                                       ['NE','SE','SW','NW']
     """
-    def __init__(self, lines):
+    __slots__ = ('_columns', '_row')
+
+    def __init__(self, columns, row):
         """
         Args
         ----
-            lines: [list(str)] List of lines from an ATCF B-deck file describing one entry
+            columns: [dict(str,array)] Column arrays of a parsed B-deck (see BDeck.dtypes)
+            row:     [int]             Row of this entry in the column arrays
         """
-        # For most attributes, can use any of the lines from the time group
-        fields = [s.strip() for s in lines[0].split(',')]
-        # Two-letter ocean basin designation
-        self.basin = fields[BDeck.attr_indices['basin']]
-        # Storm ID number, 90+ for invests, 01+ for TCs
-        self.number = int(fields[BDeck.attr_indices['number']])
-        # Full ID includes the basin identifier for the originating basin (e.g., 01L)
-        self.stormID = f'{self.number:02}{basinletters[self.basin]}'
-        # Storm name (not always present in the file)
+        self._columns = columns
+        self._row = row
+
+    def __getattr__(self, attr):
+        # Only reached for entry attributes, which live in the column arrays
+        if attr.startswith('_'):
+            raise AttributeError(attr)
         try:
-            self.stormname = fields[BDeck.attr_indices['name']]
-        except IndexError:
-            self.stormname = 'NONAME'
-        # Observation time
-        self.time = datetime.strptime(fields[BDeck.attr_indices['time']], '%Y%m%d%H')
-        # Coordinates (longitude in [-180, 180])
-        lat, lon = fields[BDeck.attr_indices['lat']], fields[BDeck.attr_indices['lon']]
-        if lat[-1] == 'N':
-            self.lat = 0.1*float(lat[:-1])
-        elif lat[-1] == 'S':
-            self.lat = -0.1*float(lat[:-1])
-        if lon[-1] == 'W':
-            self.lon = -0.1*float(lon[:-1])
-        elif lon[-1] == 'E':
-            self.lon = 0.1*float(lon[:-1])
-        # Maximum sustained wind speed (kt)
-        self.vmax = int(fields[BDeck.attr_indices['vmax']])
-        # Attributes that may be missing and are positive definite
-        for attr in ('pmin', 'poci', 'roci', 'rmw', 'maxgust', 'eye_diameter'):
-            # These values may not exist in the entry at all
-            try:
-                valstr = fields[BDeck.attr_indices[attr]]
-            except IndexError:
-                value = np.nan
-            else:
-                value = int(valstr) if valstr not in BDeck.missing_values+['0'] else np.nan
-            setattr(self, attr, value)
-        # 2-letter storm classification
-        self.classification = fields[BDeck.attr_indices['classification']]
-        # Wind radii (nm) of 34 kt, 50 kt, or 64 kt, dependent on the threshold(s) specified
-        for line in lines:
-            lfields = [s.strip() for s in line.split(',')]
-            thresh = int(lfields[11]) # kt
-            if thresh == 0:
-                continue
-            attrs = [f'R{thresh}_{quad}' for quad in ('NE','SE','SW','NW')]
-            for attr in attrs:
-                setattr(self, attr, int(lfields[BDeck.attr_indices[attr]]))
-        # Set wind radii that are not present to missing
-        radii_attrs = [f'R{thresh}_{q}' for thresh in (34, 50, 64) for q in ('NE','SE','SW','NW')]
-        for attr in radii_attrs:
-            if not getattr(self, attr, None):
-                setattr(self, attr, np.nan)
+            column = self._columns[attr]
+        except KeyError:
+            raise AttributeError(f"'BDeckEntry' object has no attribute '{attr}'") from None
+        return column.item(self._row)
+
+    @property
+    def wind_radii(self):
+        # A (threshold, quadrant) view onto this entry's row of the wind radii array
+        return self._columns['wind_radii'][self._row]
 
     def __repr__(self):
         return self.__str__()
@@ -510,6 +999,7 @@ class Storm:
     Attributes
     ----------
         ID:             [str]             Storm ID (e.g., '01L')
+        number:         [int]             Storm ID number, 90+ for invests, 01+ for TCs
         name:           [str]             Storm name ('NONAME' if no defined name)
         basin:          [array(str)]      2-letter basin IDs at each time (e.g., 'AL')
         classification: [array(str)]      2-letter storm classification (e.g., 'TS')
@@ -529,6 +1019,9 @@ class Storm:
                                           where `quad` is one of ['NE','SE','SW','NW']
         R64_{quad}:     [array(float)]    Radius of 64kt wind (nm) in the `quad` quadrant,
                                           where `quad` is one of ['NE','SE','SW','NW']
+        wind_radii:     [array(float)]    All wind radii (nm), with shape (time, threshold,
+                                          quadrant) for thresholds [34,50,64] and quadrants
+                                          ['NE','SE','SW','NW']. R##_{quad} are views onto it
     """
     def __init__(self, bdeck):
         """
@@ -538,21 +1031,27 @@ class Storm:
         """
         # Collect time-dependent attributes
         dtypes = {
-            'basin': 'U2', 'lat': float, 'lon': float, 'time': 'datetime64[m]',
-            'vmax': float, 'pmin': float, 'rmw': float, 'poci': float, 'roci': float,
-            'maxgust': float, 'eye_diameter': float, 'R34_NE': float, 'R34_SE': float,
-            'R34_SW': float, 'R34_NW': float, 'R50_NE': float, 'R50_SE': float,
-            'R50_SW': float, 'R50_NW': float, 'R64_NE': float, 'R64_SE': float,
-            'R64_SW': float, 'R64_NW': float, 'classification': 'U2'
+            'basin': 'U2', 'lat': np.float32, 'lon': np.float32, 'time': 'datetime64[m]',
+            'vmax': np.float32, 'pmin': np.float32, 'rmw': np.float32, 'poci': np.float32,
+            'roci': np.float32, 'maxgust': np.float32, 'eye_diameter': np.float32,
+            'classification': 'U2', 'wind_radii': np.float32
         }
-        # Create arrays
+        # The B-deck columns are already time-ordered arrays, so each is copied whole
+        # rather than gathered from the entries. Copies keep modifications of a storm
+        # (e.g., shifting longitudes) from modifying the B-deck
         for attr, dtype in dtypes.items():
-            arr = np.array([getattr(entry, attr) for entry in bdeck.entries], dtype=dtype)
-            setattr(self, attr, arr)
-
-        # Collect time-invariant attributes. Make sure to use latest entry
-        self.ID = bdeck.entries[-1].stormID
-        self.name = bdeck.entries[-1].stormname
+            setattr(self, attr, bdeck._columns[attr].astype(dtype))
+        for attr, radii in _radii_views(self.wind_radii).items():
+            setattr(self, attr, radii)
+
+        # Collect time-invariant attributes once, rather than as per-time arrays.
+        # Make sure to use latest entry. The ID and name are interned, since they
+        # are shared with (and compared against) many other objects
+        self.ID = sys.intern(bdeck._columns['stormID'].item(-1))
+        self.number = bdeck._columns['number'].item(-1)
+        self.name = sys.intern(bdeck._columns['stormname'].item(-1))
+        # The storm's identity is fixed, so its hash is only computed once
+        self._hash = hash((self.ID, self.name))
 
     def __hash__(self):
-        return hash((self.ID, self.name))
+        return self._hash
@@ -0,0 +1,97 @@
+"""
+Check that the compiled byte scanner and the Python tokenizer parse the same
+columns from well-formed and malformed ATCF lines
+"""
+import numpy as np
+import pytest
+
+from atcf import atcf
+
+numba = pytest.importorskip('numba')
+
+LINE = ('AL, 09, 2020080100, 03, BEST,   0, 150N, 500W,  20, 1010, TS,  34, NEQ,   20,'
+        '   20,    0,   20, 1012,  200,  25,   0,   0,   L,   0,    ,   0,   0, {name},')
+
+LINES = [
+    LINE.format(name='INVEST'),
+    # Names longer than 16 bytes, and with multi-byte characters
+    LINE.format(name='SUPERLONGSTORMNAMEXYZ'),
+    LINE.format(name='ÉTÉ–NAMÉ'),
+    # Malformed integer fields
+    LINE.replace(' 1010,', ' 12.5,').format(name='A'),
+    LINE.replace(' 1010,', ' 1e3,').format(name='A'),
+    LINE.replace(' 1010,', ' nan,').format(name='A'),
+    LINE.replace(' 1010,', ' 1_000,').format(name='A'),
+    LINE.replace(' 1010,', ' ٣,').format(name='A'),
+    LINE.replace(' 1010,', ' --5,').format(name='A'),
+    LINE.replace(' 1010,', ' +7,').format(name='A'),
+    LINE.replace(' 1010,', ' ,').format(name='A'),
+    # Malformed coordinates
+    LINE.replace('150N', '2²N').format(name='A'),
+    LINE.replace('150N', '12NN').format(name='A'),
+    LINE.replace('150N', '12SN').format(name='A'),
+    # Short lines, and lines with whitespace around them
+    'AL, 09, 2020080100',
+    'AL',
+    '\t' + LINE.format(name='B') + '\r',
+    ' , , ,',
+]
+
+
+def _compare(text, deck):
+    lines = [l for l in map(str.strip, text.split('\n')) if l]
+    buf = np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+    scanned = atcf._scan_bytes(buf, deck.text_fields, deck.int_fields)
+    tokenized = atcf._tokenize_lines(lines, deck.text_fields, deck.int_fields)
+    assert scanned.keys() == tokenized.keys()
+    for name in tokenized:
+        np.testing.assert_array_equal(scanned[name], tokenized[name], err_msg=name)
+
+
+@pytest.mark.parametrize('deck', [atcf.ADeck, atcf.BDeck])
+def test_scan_matches_tokenize(deck):
+    _compare('\n'.join(LINES) + '\n', deck)
+
+
+@pytest.mark.parametrize('deck', [atcf.ADeck, atcf.BDeck])
+def test_scan_matches_tokenize_with_blank_lines(deck):
+    _compare('\n \n' + '\n\t\n'.join(LINES) + '\n\n', deck)
+
+
+@pytest.mark.parametrize('values', [
+    ['165N', '12S', '2²N', '12NN', '12SN', 'N', '', '٣N', '0N', 'x1N'],
+])
+def test_coordinates_match(values, monkeypatch):
+    values = np.array(values)
+    monkeypatch.setattr(atcf, '_NUMBA_MIN_LINES', 1)
+    compiled = atcf._parse_coordinates(values, 'N', 'S')
+    monkeypatch.setattr(atcf, '_NUMBA_MIN_LINES', 10**9)
+    python = atcf._parse_coordinates(values, 'N', 'S')
+    np.testing.assert_array_equal(compiled, python)
+
+
+def test_read_deck_non_ascii_space(tmp_path, monkeypatch):
+    # A line of only non-ASCII whitespace is blank to str.strip() but not to the
+    # compiled kernel, so such files must not be parsed by it
+    monkeypatch.setattr(atcf, '_NUMBA_MIN_LINES', 1)
+    monkeypatch.setattr(atcf, '_deck_cache_size', 0)
+    path = tmp_path / 'bal.dat'
+    path.write_text(LINES[0] + '\n\xa0\n' + LINES[1].replace('2020080100', '2020080106')
+                    + '\n', encoding='utf-8')
+    lines, table = atcf._read_deck(path, atcf.BDeck.text_fields, atcf.BDeck.int_fields)
+    assert len(lines) == len(table['nfields']) == 2
+    assert len(atcf.BDeck(path).entries) == 2
+
+
+def test_read_deck_kernel_error(tmp_path, monkeypatch):
+    # An error in the compiled path must not be hidden by the memory map failing
+    # to close while the buffer is still referenced
+    def fail(buf, text_fields, int_fields):
+        raise RuntimeError('kernel failed')
+    monkeypatch.setattr(atcf, '_NUMBA_MIN_LINES', 1)
+    monkeypatch.setattr(atcf, '_deck_cache_size', 0)
+    monkeypatch.setattr(atcf, '_scan_bytes', fail)
+    path = tmp_path / 'bal.dat'
+    path.write_text(LINES[0] + '\n', encoding='utf-8')
+    with pytest.raises(RuntimeError, match='kernel failed'):
+        atcf.BDeck(path)